@@ -5,17 +5,38 @@ Script para listar documentos processados pelo JURISRAG
 
 import os
 import json
-from pathlib import Path
+from collections import defaultdict
 from datetime import datetime
 from colorama import Fore, Style, init
 
-init(autoreset=True)
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json module
+    orjson = None
+
+init()
+
+# Escape sequences for print_header, built once instead of on every call
+_RESET = Style.RESET_ALL
+_HEADER = Style.BRIGHT + Fore.CYAN
+_HEADER_RULE = f"{_HEADER}{'=' * 70}{_RESET}"
 
 def print_header(message):
     """Print a header message"""
-    print(f"{Style.BRIGHT}{Fore.CYAN}{'=' * 70}{Style.RESET_ALL}")
-    print(f"{Style.BRIGHT}{Fore.CYAN}{message}{Style.RESET_ALL}")
-    print(f"{Style.BRIGHT}{Fore.CYAN}{'=' * 70}{Style.RESET_ALL}")
+    print(_HEADER_RULE)
+    print(_HEADER, message, _RESET, sep="")
+    print(_HEADER_RULE)
+
+def _iter_docx(root):
+    """Yield paths of all .docx files under root using a stack-based os.scandir walk."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".docx") and entry.is_file(follow_symlinks=False):
+                    yield entry.path
 
 def list_source_documents():
     """Lista todos os documentos .docx encontrados"""
@@ -28,19 +49,18 @@ def list_source_documents():
     print(f"{Fore.BLUE}ℹ️  Scanning directory: {data_dir}{Style.RESET_ALL}\n")
 
     # Find all .docx files
-    docx_files = sorted(Path(data_dir).rglob("*.docx"))
+    docx_files = sorted(_iter_docx(data_dir))
 
-    # Group by subdirectory
-    grouped = {}
+    # Group by subdirectory. docx_files is sorted, and paths in the same directory share
+    # their prefix, so each category's file list is already in sorted order.
+    grouped = defaultdict(list)
     for file in docx_files:
         # Get relative path from data_dir
-        rel_path = file.relative_to(data_dir)
+        rel_path = os.path.relpath(file, data_dir)
         # Get parent directory
-        parent = str(rel_path.parent) if rel_path.parent != Path(".") else "Root"
-
-        if parent not in grouped:
-            grouped[parent] = []
-        grouped[parent].append(rel_path.name)
+        parent = os.path.dirname(rel_path) or "Root"
+        grouped[parent].append(os.path.basename(rel_path))
+    sorted_categories = sorted(grouped)
 
     # Print summary
     print_header(f"📚 JURISRAG - Lista de Documentos")
@@ -50,10 +70,10 @@ def list_source_documents():
     print()
 
     # Print grouped files
-    for category in sorted(grouped.keys()):
+    for category in sorted_categories:
         files = grouped[category]
         print(f"{Style.BRIGHT}{Fore.CYAN}📁 {category}{Style.RESET_ALL} ({len(files)} arquivos)")
-        for i, filename in enumerate(sorted(files), 1):
+        for i, filename in enumerate(files, 1):
             print(f"   {i:3d}. {filename}")
         print()
 
@@ -64,14 +84,15 @@ def list_source_documents():
         "total_documents": len(docx_files),
         "total_categories": len(grouped),
         "generated_at": datetime.now().isoformat(),
-        "categories": {}
+        "categories": {category: grouped[category] for category in sorted_categories}
     }
 
-    for category, files in grouped.items():
-        doc_list["categories"][category] = sorted(files)
-
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(doc_list, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(doc_list, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(doc_list, f, ensure_ascii=False, indent=2)
 
     print(f"{Fore.GREEN}✅ Lista salva em: {output_file}{Style.RESET_ALL}")
 
@@ -84,13 +105,10 @@ def check_vectorstore_status():
     print()
 
     if os.path.exists(vectorstore_path):
-        files = os.listdir(vectorstore_path)
+        with os.scandir(vectorstore_path) as it:
+            files = list(it)
         if files:
-            total_size = sum(
-                os.path.getsize(os.path.join(vectorstore_path, f))
-                for f in files
-                if os.path.isfile(os.path.join(vectorstore_path, f))
-            )
+            total_size = sum(e.stat().st_size for e in files if e.is_file())
             print(f"{Fore.GREEN}✅ Vectorstore criado{Style.RESET_ALL}")
             print(f"   📁 Localização: {vectorstore_path}/")
             print(f"   📄 Arquivos: {len(files)}")
@@ -111,18 +129,21 @@ def check_log_file():
 
     if os.path.exists(log_file):
         size = os.path.getsize(log_file)
-        with open(log_file, 'r') as f:
-            lines = f.readlines()
+        with open(log_file, 'rb') as f:
+            # Count lines in 1 MiB blocks, then read only the tail for display
+            line_count = sum(block.count(b"\n") for block in iter(lambda: f.read(1 << 20), b""))
+            f.seek(max(0, size - 8192))
+            tail = f.read().splitlines()[-5:]
 
         print(f"{Fore.GREEN}✅ Arquivo de log encontrado{Style.RESET_ALL}")
         print(f"   📁 Localização: {log_file}")
-        print(f"   📄 Linhas: {len(lines)}")
+        print(f"   📄 Linhas: {line_count}")
         print(f"   💾 Tamanho: {size / 1024:.2f} KB")
 
         # Show last few lines
         print(f"\n{Style.BRIGHT}Últimas 5 linhas do log:{Style.RESET_ALL}")
-        for line in lines[-5:]:
-            print(f"   {line.rstrip()}")
+        for line in tail:
+            print(f"   {line.decode('utf-8', errors='replace').rstrip()}")
     else:
         print(f"{Fore.YELLOW}⚠️  Arquivo de log não encontrado{Style.RESET_ALL}")
 
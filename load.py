@@ -1,19 +1,33 @@
 import os
 import sys
+import asyncio
+import hashlib
+import json
 import logging
+import pickle
+import re
+import sqlite3
 import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
+import faiss
+import numpy as np
+import tiktoken
 from dotenv import load_dotenv
+from openai import AsyncOpenAI
 from colorama import Fore, Back, Style, init
-from langchain_community.document_loaders import DirectoryLoader, Docx2txtLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+import docx2txt
+from langchain_core.documents import Document
 from langchain_openai import OpenAIEmbeddings
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
 from tqdm import tqdm
 
-# Initialize colorama for cross-platform color support
-init(autoreset=True)
+# Initialize colorama for cross-platform color support. No autoreset: the print helpers
+# reset explicitly, and without it colorama doesn't wrap stdout/stderr on POSIX terminals.
+init()
 
 load_dotenv()
 
@@ -28,34 +42,83 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Directory containing the source .docx documents
+DATA_DIR = "/Users/gabrielramos/Downloads/DRIVE_DO_BELISARIO"
+
+# Chunk length and overlap in characters, shared by split_documents and the chunk checkpoint
+CHUNK_SIZE = 1000
+CHUNK_OVERLAP = 200
+
+# Bump whenever _split_text's output changes, so chunk checkpoints from older versions are discarded
+CHUNKER_VERSION = 2
+
+# Worker processes used to parse .docx files (docx2txt is GIL-bound, so threads don't help)
+LOAD_WORKERS = int(os.getenv("JURISRAG_LOAD_WORKERS", max(1, (os.cpu_count() or 2) - 1)))
+
+# Chunks saved after splitting, so a failed embedding run can resume without reloading
+CHUNKS_CHECKPOINT_PATH = "chunks.pkl"
+
+# Last directory scan, reused while no directory mtime has changed
+SCAN_CACHE_PATH = ".jurisrag_scan.json"
+
+# Extracted .docx text, cached per (path, mtime, size) so unchanged files aren't re-parsed
+DOC_CACHE_DIR = Path(".doc_cache")
+
+# Embedding model; main.py must use the same one to embed queries
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Embedding requests: inputs and tokens per request, tokens per input (OpenAI limits)
+# and requests in flight at once
+EMBED_BATCH_SIZE = 2048
+EMBED_BATCH_TOKENS = 300_000
+EMBED_MAX_INPUT_TOKENS = 8191
+EMBED_CONCURRENCY = int(os.getenv("JURISRAG_EMBED_CONCURRENCY", 16))
+
+# On-disk cache of embedding vectors keyed by SHA-256 of (model, chunk text)
+EMBEDDING_CACHE_PATH = "embedding_cache.sqlite"
+
+# HNSW graph parameters: neighbours per node and search depth while building.
+# Vectors are stored as 8-bit scalar-quantized codes (4x smaller than float32).
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+
+# Escape sequences for the print helpers, built once instead of on every call
+_RESET = Style.RESET_ALL
+_HEADER = Style.BRIGHT + Fore.CYAN
+_HEADER_RULE = f"{_HEADER}{'=' * 70}{_RESET}"
+_SUCCESS_PREFIX = f"{Style.BRIGHT}{Fore.GREEN}✅ "
+_INFO_PREFIX = f"{Style.NORMAL}{Fore.BLUE}ℹ️  "
+_WARNING_PREFIX = f"{Style.BRIGHT}{Fore.YELLOW}⚠️  "
+_ERROR_PREFIX = f"{Style.BRIGHT}{Fore.RED}❌ "
+
 def print_color(message, color=Fore.WHITE, style=Style.NORMAL):
     """Print colored message to console"""
-    print(f"{style}{color}{message}{Style.RESET_ALL}")
+    print(style, color, message, _RESET, sep="")
 
 def print_header(message):
     """Print a header message"""
-    print_color("=" * 70, Fore.CYAN, Style.BRIGHT)
-    print_color(message, Fore.CYAN, Style.BRIGHT)
-    print_color("=" * 70, Fore.CYAN, Style.BRIGHT)
+    print(_HEADER_RULE)
+    print(_HEADER, message, _RESET, sep="")
+    print(_HEADER_RULE)
 
 def print_success(message):
     """Print success message"""
-    print_color(f"✅ {message}", Fore.GREEN, Style.BRIGHT)
+    print(_SUCCESS_PREFIX, message, _RESET, sep="")
     logger.info(message)
 
 def print_info(message):
     """Print info message"""
-    print_color(f"ℹ️  {message}", Fore.BLUE)
+    print(_INFO_PREFIX, message, _RESET, sep="")
     logger.info(message)
 
 def print_warning(message):
     """Print warning message"""
-    print_color(f"⚠️  {message}", Fore.YELLOW, Style.BRIGHT)
+    print(_WARNING_PREFIX, message, _RESET, sep="")
     logger.warning(message)
 
 def print_error(message):
     """Print error message"""
-    print_color(f"❌ {message}", Fore.RED, Style.BRIGHT)
+    print(_ERROR_PREFIX, message, _RESET, sep="")
     logger.error(message)
 
 def validate_environment():
@@ -77,7 +140,80 @@ def validate_environment():
     logger.debug(f"API key starts with: {api_key[:20]}...")
     return True
 
-def load_documents(data_dir="/Users/gabrielramos/Downloads/DRIVE_DO_BELISARIO"):
+def _iter_docx(root, dir_mtimes=None):
+    """Yield paths of all non-hidden .docx files under root using a stack-based os.scandir walk.
+
+    If dir_mtimes is given, it is filled with the st_mtime_ns of every directory visited.
+    """
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        if dir_mtimes is not None:
+            dir_mtimes[path] = os.stat(path).st_mtime_ns
+        with os.scandir(path) as it:
+            for entry in it:
+                # Skip hidden entries (e.g. macOS "._*.docx" AppleDouble files), like DirectoryLoader did
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".docx") and entry.is_file(follow_symlinks=False):
+                    yield entry.path
+
+def _list_docx(data_dir):
+    """Return the sorted .docx paths under data_dir, reusing the cached scan if no directory changed.
+
+    Adding, removing or renaming a file updates its directory's mtime, so re-checking one stat()
+    per directory is enough to detect a stale file list.
+    """
+    root = os.path.abspath(data_dir)
+    try:
+        with open(SCAN_CACHE_PATH, encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache["root"] == root and all(os.stat(d).st_mtime_ns == m for d, m in cache["dirs"].items()):
+            logger.info(f"Reusing directory scan from {SCAN_CACHE_PATH}")
+            return cache["files"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    dir_mtimes = {}
+    files = sorted(_iter_docx(root, dir_mtimes))
+
+    tmp_path = f"{SCAN_CACHE_PATH}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"root": root, "dirs": dir_mtimes, "files": files}, f, ensure_ascii=False)
+    os.replace(tmp_path, SCAN_CACHE_PATH)
+    return files
+
+def _load_one(path):
+    """Extract the text of a single .docx file (runs in a worker process).
+
+    The extracted text is cached in DOC_CACHE_DIR, so a file is only parsed again after it
+    changes. An unreadable cache entry is treated as a miss and overwritten.
+    """
+    st = os.stat(path)
+    key = f"{os.path.abspath(path)}:{st.st_mtime_ns}:{st.st_size}"
+    cache_path = DOC_CACHE_DIR / hashlib.sha1(key.encode()).hexdigest()
+    text = None
+    try:
+        text = pickle.loads(cache_path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except Exception:
+        logger.warning(f"Ignoring unreadable cache entry {cache_path} for {path}")
+
+    if not isinstance(text, str):
+        text = docx2txt.process(path)
+
+        # Write to a per-process temp file and rename, so concurrent workers never see partial data
+        DOC_CACHE_DIR.mkdir(exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(pickle.dumps(text, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp_path, cache_path)
+
+    return Document(page_content=text, metadata={"source": path})
+
+def load_documents(data_dir=DATA_DIR):
     """Load all .docx documents from the specified directory."""
     start_time = time.time()
     print_info(f"Loading documents from: {data_dir}")
@@ -90,7 +226,7 @@ def load_documents(data_dir="/Users/gabrielramos/Downloads/DRIVE_DO_BELISARIO"):
 
     # Count files first for progress indication
     print_info("Scanning directory for .docx files...")
-    docx_files = list(Path(data_dir).rglob("*.docx"))
+    docx_files = _list_docx(data_dir)
     num_files = len(docx_files)
 
     if num_files == 0:
@@ -99,21 +235,22 @@ def load_documents(data_dir="/Users/gabrielramos/Downloads/DRIVE_DO_BELISARIO"):
         sys.exit(1)
 
     print_success(f"Found {num_files} .docx files")
-    logger.info(f"File list: {[str(f) for f in docx_files[:10]]}..." if num_files > 10 else f"Files: {docx_files}")
+    logger.info(f"File list: {docx_files[:10]}..." if num_files > 10 else f"Files: {docx_files}")
 
     try:
-        loader = DirectoryLoader(
-            data_dir,
-            glob="**/*.docx",
-            loader_cls=Docx2txtLoader,
-            show_progress=True,
-            use_multithreading=True
-        )
-
-        print_info("Loading document contents...")
+        print_info(f"Loading document contents with {LOAD_WORKERS} worker processes...")
         print_color("This may take several minutes for large document collections", Fore.YELLOW)
 
-        documents = loader.load()
+        with ProcessPoolExecutor(max_workers=LOAD_WORKERS) as pool:
+            progress = tqdm(
+                pool.map(_load_one, docx_files, chunksize=8),
+                total=num_files,
+                mininterval=0.5,
+                miniters=max(1, num_files // 200),
+                smoothing=0.05,
+                disable=not sys.stderr.isatty(),
+            )
+            documents = list(progress)
 
         elapsed = time.time() - start_time
 
@@ -137,7 +274,61 @@ def load_documents(data_dir="/Users/gabrielramos/Downloads/DRIVE_DO_BELISARIO"):
         print("3. Ensure docx2txt is installed: pip install docx2txt")
         sys.exit(1)
 
-def split_documents(documents, chunk_size=1000, chunk_overlap=200):
+# Preferred chunk boundaries, best first, as (separator, characters of it kept in the chunk):
+# paragraph, line, sentence end (keeping the period), then any space
+_SEPARATORS = (("\n\n", 0), ("\n", 0), (". ", 1), (" ", 0))
+
+_WHITESPACE_RE = re.compile(r"\s")
+_NON_WHITESPACE_RE = re.compile(r"\S")
+
+def _split_text(text, chunk_size, chunk_overlap):
+    """Split text into chunks of at most chunk_size characters, overlapping by up to chunk_overlap.
+
+    Each chunk advances by at most (chunk_size - chunk_overlap) characters and ends at the last
+    paragraph break in that window, else the last line break, sentence end or space; it is only
+    cut mid-word when the window has none of these.
+    """
+    step = chunk_size - chunk_overlap
+    chunks = []
+    n = len(text)
+    start = 0
+    while True:
+        match = _NON_WHITESPACE_RE.search(text, start)
+        if not match:
+            break
+        start = match.start()
+
+        end = start + step
+        if end >= n:
+            end = n
+        else:
+            for sep, keep in _SEPARATORS:
+                cut = text.rfind(sep, start + 1, end + len(sep) - keep)
+                if cut != -1:
+                    end = cut + keep
+                    break
+
+        lo = start
+        if chunk_overlap and start:
+            # Extend backwards over the previous chunk's tail, starting at a word boundary
+            lo = max(0, start - chunk_overlap)
+            if lo and not text[lo - 1].isspace():
+                space = _WHITESPACE_RE.search(text, lo, start)
+                lo = space.end() if space else start
+        chunk = text[lo:end].strip()
+        if chunk:
+            chunks.append(chunk)
+        start = end
+    return chunks
+
+def _split_one(doc, chunk_size, chunk_overlap):
+    """Split a single document into chunk Documents."""
+    return [
+        Document(page_content=text, metadata=dict(doc.metadata))
+        for text in _split_text(doc.page_content, chunk_size, chunk_overlap)
+    ]
+
+def split_documents(documents, chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP):
     """Split documents into smaller chunks for embedding."""
     start_time = time.time()
     print_info("Splitting documents into chunks...")
@@ -145,13 +336,14 @@ def split_documents(documents, chunk_size=1000, chunk_overlap=200):
     print_color(f"   Chunk overlap: {chunk_overlap} characters", Fore.CYAN)
 
     try:
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            length_function=len,
-        )
+        if chunk_overlap >= chunk_size:
+            raise ValueError(f"chunk_overlap ({chunk_overlap}) must be smaller than chunk_size ({chunk_size})")
 
-        chunks = text_splitter.split_documents(documents)
+        # Splitting is a few C-level string searches per chunk; running it in-process is faster
+        # than pickling documents and chunks to and from worker processes
+        chunks = []
+        for doc in documents:
+            chunks.extend(_split_one(doc, chunk_size, chunk_overlap))
 
         elapsed = time.time() - start_time
 
@@ -162,7 +354,8 @@ def split_documents(documents, chunk_size=1000, chunk_overlap=200):
         avg_chunks = len(chunks) / len(documents)
         print_success(f"Created {len(chunks)} chunks from {len(documents)} documents in {elapsed:.2f}s")
         print_info(f"Average: {avg_chunks:.1f} chunks per document")
-        logger.info(f"Chunk sizes - min: {min(len(c.page_content) for c in chunks)}, max: {max(len(c.page_content) for c in chunks)}, avg: {sum(len(c.page_content) for c in chunks)/len(chunks):.0f}")
+        lengths = np.fromiter((len(c.page_content) for c in chunks), dtype=np.int64, count=len(chunks))
+        logger.info(f"Chunk sizes - min: {lengths.min()}, max: {lengths.max()}, avg: {lengths.mean():.0f}")
 
         return chunks
 
@@ -171,6 +364,165 @@ def split_documents(documents, chunk_size=1000, chunk_overlap=200):
         logger.exception("Full traceback:")
         sys.exit(1)
 
+def docx_signature(data_dir=DATA_DIR):
+    """Return (path, mtime, size) for each .docx under data_dir, or None if the directory is missing.
+
+    Used to tell whether a chunk checkpoint is stale. Take it before loading the documents, so a
+    file edited while the pipeline runs makes the checkpoint stale instead of looking current.
+    """
+    if not os.path.exists(data_dir):
+        return None
+    signature = []
+    for path in _list_docx(data_dir):
+        st = os.stat(path)
+        signature.append((path, st.st_mtime_ns, st.st_size))
+    return signature
+
+def save_chunks_checkpoint(chunks, signature, chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP):
+    """Save chunks to CHUNKS_CHECKPOINT_PATH along with the inputs they were built from.
+
+    signature is the docx_signature() taken before the documents were loaded.
+    """
+    checkpoint = {
+        "signature": signature,
+        "chunker_version": CHUNKER_VERSION,
+        "chunk_size": chunk_size,
+        "chunk_overlap": chunk_overlap,
+        "chunks": chunks,
+    }
+    tmp_path = f"{CHUNKS_CHECKPOINT_PATH}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(checkpoint, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, CHUNKS_CHECKPOINT_PATH)
+    logger.info(f"Saved {len(chunks)} chunks to {CHUNKS_CHECKPOINT_PATH}")
+
+def load_chunks_checkpoint(signature, chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP):
+    """Return the checkpointed chunks, or None if there is no checkpoint or any input changed."""
+    if signature is None or not os.path.exists(CHUNKS_CHECKPOINT_PATH):
+        return None
+
+    try:
+        with open(CHUNKS_CHECKPOINT_PATH, "rb") as f:
+            checkpoint = pickle.load(f)
+        if checkpoint.get("chunker_version") != CHUNKER_VERSION:
+            return None
+        if (checkpoint["chunk_size"], checkpoint["chunk_overlap"]) != (chunk_size, chunk_overlap):
+            return None
+        if checkpoint["signature"] != signature:
+            return None
+    except Exception:
+        logger.exception(f"Ignoring unreadable checkpoint {CHUNKS_CHECKPOINT_PATH}:")
+        return None
+
+    return checkpoint["chunks"]
+
+def _token_batches(texts):
+    """Tokenize texts once and pack the token lists into batches within the request limits.
+
+    Returns (start, batch) pairs, where start is the index in texts of the batch's first input.
+    """
+    # text-embedding-3-* use cl100k_base; looked up by name so older tiktoken releases work too
+    encoding = tiktoken.get_encoding("cl100k_base")
+    token_lists = encoding.encode_ordinary_batch(texts, num_threads=os.cpu_count() or 1)
+
+    batches, batch, batch_tokens, start = [], [], 0, 0
+    for i, tokens in enumerate(token_lists):
+        tokens = tokens[:EMBED_MAX_INPUT_TOKENS]
+        if batch and (len(batch) == EMBED_BATCH_SIZE or batch_tokens + len(tokens) > EMBED_BATCH_TOKENS):
+            batches.append((start, batch))
+            batch, batch_tokens, start = [], 0, i
+        batch.append(tokens)
+        batch_tokens += len(tokens)
+    if batch:
+        batches.append((start, batch))
+    return batches
+
+async def _embed_texts(texts, on_batch):
+    """Embed texts in concurrent batches, capping the number of in-flight requests.
+
+    Texts are sent as pre-computed token IDs, so each one is tokenized exactly once.
+    on_batch(start, vectors) is called as each batch completes, so finished batches are kept
+    even if a later one fails; the remaining requests are cancelled on failure.
+    """
+    client = AsyncOpenAI(max_retries=8, timeout=60)
+    semaphore = asyncio.Semaphore(EMBED_CONCURRENCY)
+
+    async def embed_batch(start, batch):
+        async with semaphore:
+            response = await client.embeddings.create(model=EMBEDDING_MODEL, input=batch)
+        return start, [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    tasks = [asyncio.ensure_future(embed_batch(start, batch)) for start, batch in _token_batches(texts)]
+    try:
+        for future in asyncio.as_completed(tasks):
+            start, vectors = await future
+            on_batch(start, vectors)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await client.close()
+
+def _embed_with_cache(texts):
+    """Embed texts, reusing vectors stored in the embedding cache and caching new ones.
+
+    Identical texts are embedded once and share the resulting vector. New vectors are committed
+    batch by batch, so an interrupted run keeps everything embedded before the failure. Returns
+    the list of vectors (float32 arrays), the number of cache hits and the number of texts sent
+    to OpenAI.
+    """
+    keys = [hashlib.sha256(f"{EMBEDDING_MODEL}\0{text}".encode()).digest() for text in texts]
+    conn = sqlite3.connect(EMBEDDING_CACHE_PATH)
+    try:
+        conn.execute("CREATE TABLE IF NOT EXISTS embeddings (sha256 BLOB PRIMARY KEY, vec BLOB)")
+
+        cached = {}
+        unique_keys = list(set(keys))
+        for i in range(0, len(unique_keys), 500):
+            batch = unique_keys[i:i + 500]
+            rows = conn.execute(
+                f"SELECT sha256, vec FROM embeddings WHERE sha256 IN ({','.join('?' * len(batch))})",
+                batch
+            )
+            cached.update((key, np.frombuffer(vec, dtype=np.float32)) for key, vec in rows)
+
+        cache_hits = sum(1 for key in keys if key in cached)
+
+        # One representative text per distinct uncached key
+        misses = {}
+        for i, key in enumerate(keys):
+            if key not in cached and key not in misses:
+                misses[key] = i
+        miss_keys = list(misses)
+
+        def store_batch(start, vectors):
+            new_rows = []
+            for key, vector in zip(miss_keys[start:start + len(vectors)], vectors):
+                vector = np.asarray(vector, dtype=np.float32)
+                cached[key] = vector
+                new_rows.append((key, vector.tobytes()))
+            conn.executemany("INSERT OR REPLACE INTO embeddings (sha256, vec) VALUES (?, ?)", new_rows)
+            conn.commit()
+
+        if misses:
+            asyncio.run(_embed_texts([texts[i] for i in misses.values()], store_batch))
+
+        return [cached[key] for key in keys], cache_hits, len(misses)
+    finally:
+        conn.close()
+
+def _build_vectorstore(chunks, vectors, embeddings):
+    """Build a FAISS vectorstore over an int8-quantized HNSW index from precomputed vectors."""
+    matrix = np.vstack(vectors).astype(np.float32, copy=False)
+    index = faiss.IndexHNSWSQ(matrix.shape[1], faiss.ScalarQuantizer.QT_8bit, HNSW_M)
+    index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+    index.train(matrix)
+    index.add(matrix)
+
+    ids = [str(uuid.uuid4()) for _ in chunks]
+    docstore = InMemoryDocstore(dict(zip(ids, chunks)))
+    return FAISS(embeddings, index, docstore, dict(enumerate(ids)))
+
 def create_vectorstore(chunks):
     """Create FAISS vectorstore from document chunks using OpenAI embeddings."""
     start_time = time.time()
@@ -179,13 +531,19 @@ def create_vectorstore(chunks):
     print_warning("This may take several minutes and will consume OpenAI API credits")
 
     try:
-        embeddings = OpenAIEmbeddings()
+        embeddings = OpenAIEmbeddings(model=EMBEDDING_MODEL, max_retries=8, timeout=60)
 
         # Create vectorstore with progress indication
-        print_info("Generating embeddings from OpenAI...")
+        print_info(f"Generating embeddings from OpenAI ({EMBED_CONCURRENCY} concurrent requests)...")
         print_color("   This is the slowest step - please be patient", Fore.YELLOW)
 
-        vectorstore = FAISS.from_documents(chunks, embeddings)
+        texts = [chunk.page_content for chunk in chunks]
+        vectors, cache_hits, num_sent = _embed_with_cache(texts)
+        num_duplicates = len(texts) - cache_hits - num_sent
+        print_info(f"Embedding cache: {cache_hits} hits, {num_duplicates} duplicate chunks, {num_sent} chunks sent to OpenAI")
+
+        print_info("Building quantized HNSW index...")
+        vectorstore = _build_vectorstore(chunks, vectors, embeddings)
 
         embedding_time = time.time() - start_time
 
@@ -199,8 +557,9 @@ def create_vectorstore(chunks):
 
         # Verify save was successful
         if os.path.exists(vectorstore_path) and os.path.isdir(vectorstore_path):
-            files = os.listdir(vectorstore_path)
-            file_sizes = sum(os.path.getsize(os.path.join(vectorstore_path, f)) for f in files if os.path.isfile(os.path.join(vectorstore_path, f)))
+            with os.scandir(vectorstore_path) as it:
+                files = list(it)
+            file_sizes = sum(e.stat().st_size for e in files if e.is_file())
             print_success(f"Vectorstore saved successfully ({len(files)} files, {file_sizes/1024/1024:.2f} MB)")
             print_info(f"Embedding generation: {embedding_time:.2f}s ({len(chunks)/embedding_time:.2f} chunks/s)")
             print_info(f"Total time: {total_time:.2f}s")
@@ -233,13 +592,24 @@ if __name__ == "__main__":
         validate_environment()
         print()
 
-        # Load documents
-        docs = load_documents()
-        print()
+        # Resume from the chunk checkpoint when no document changed since it was written
+        # Snapshot the inputs before loading, so edits made during this run invalidate the checkpoint
+        signature = docx_signature()
+        chunks = load_chunks_checkpoint(signature)
+        if chunks is not None:
+            print_success(f"Resuming from {CHUNKS_CHECKPOINT_PATH} ({len(chunks)} chunks, no documents changed)")
+            num_docs = len({chunk.metadata["source"] for chunk in chunks})
+            print()
+        else:
+            # Load documents
+            docs = load_documents()
+            num_docs = len(docs)
+            print()
 
-        # Split into chunks
-        chunks = split_documents(docs)
-        print()
+            # Split into chunks
+            chunks = split_documents(docs)
+            save_chunks_checkpoint(chunks, signature)
+            print()
 
         # Create and save vectorstore
         vectorstore = create_vectorstore(chunks)
@@ -251,10 +621,10 @@ if __name__ == "__main__":
         print()
         print_success(f"Total pipeline time: {overall_time:.2f}s ({overall_time/60:.2f} minutes)")
         print_color("\nStatistics:", Fore.CYAN, Style.BRIGHT)
-        print(f"  • Documents processed: {len(docs)}")
+        print(f"  • Documents processed: {num_docs}")
         print(f"  • Chunks created: {len(chunks)}")
-        print(f"  • Average chunks per doc: {len(chunks)/len(docs):.1f}")
-        print(f"  • Processing speed: {len(docs)/(overall_time/60):.2f} docs/min")
+        print(f"  • Average chunks per doc: {len(chunks)/num_docs:.1f}")
+        print(f"  • Processing speed: {num_docs/(overall_time/60):.2f} docs/min")
         print()
         print_color("Next steps:", Fore.GREEN, Style.BRIGHT)
         print("1. Run 'python main.py' to start the interactive Q&A system")
@@ -3,17 +3,17 @@
 import os
 import sys
 import logging
-from pathlib import Path
+from functools import lru_cache
+import httpx
 from dotenv import load_dotenv
 from colorama import Fore, Style, init
-from langchain_community.document_loaders import DirectoryLoader, Docx2txtLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+from langchain_core.callbacks import StreamingStdOutCallbackHandler
 from langchain_openai import OpenAIEmbeddings, ChatOpenAI
 from langchain_community.vectorstores import FAISS
 from langchain.chains import RetrievalQA
 
 # Initialize colorama
-init(autoreset=True)
+init()
 
 load_dotenv()
 
@@ -28,36 +28,65 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# httpx logs every request at INFO; keep it out of the streamed answers on stdout
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# Must match the model used by load.py to build the vectorstore
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# HNSW search depth per query (higher = better recall, slower queries)
+HNSW_EF_SEARCH = 64
+
+# Escape sequences for the print helpers, built once instead of on every call
+_RESET = Style.RESET_ALL
+_HEADER = Style.BRIGHT + Fore.CYAN
+_HEADER_RULE = f"{_HEADER}{'=' * 70}{_RESET}"
+_SUCCESS_PREFIX = f"{Style.BRIGHT}{Fore.GREEN}✅ "
+_INFO_PREFIX = f"{Style.NORMAL}{Fore.BLUE}ℹ️  "
+_WARNING_PREFIX = f"{Style.BRIGHT}{Fore.YELLOW}⚠️  "
+_ERROR_PREFIX = f"{Style.BRIGHT}{Fore.RED}❌ "
+
 def print_color(message, color=Fore.WHITE, style=Style.NORMAL):
     """Print colored message to console"""
-    print(f"{style}{color}{message}{Style.RESET_ALL}")
+    print(style, color, message, _RESET, sep="")
 
 def print_header(message):
     """Print a header message"""
-    print_color("=" * 70, Fore.CYAN, Style.BRIGHT)
-    print_color(message, Fore.CYAN, Style.BRIGHT)
-    print_color("=" * 70, Fore.CYAN, Style.BRIGHT)
+    print(_HEADER_RULE)
+    print(_HEADER, message, _RESET, sep="")
+    print(_HEADER_RULE)
 
 def print_success(message):
     """Print success message"""
-    print_color(f"✅ {message}", Fore.GREEN, Style.BRIGHT)
+    print(_SUCCESS_PREFIX, message, _RESET, sep="")
     logger.info(message)
 
 def print_info(message):
     """Print info message"""
-    print_color(f"ℹ️  {message}", Fore.BLUE)
+    print(_INFO_PREFIX, message, _RESET, sep="")
     logger.info(message)
 
 def print_warning(message):
     """Print warning message"""
-    print_color(f"⚠️  {message}", Fore.YELLOW, Style.BRIGHT)
+    print(_WARNING_PREFIX, message, _RESET, sep="")
     logger.warning(message)
 
 def print_error(message):
     """Print error message"""
-    print_color(f"❌ {message}", Fore.RED, Style.BRIGHT)
+    print(_ERROR_PREFIX, message, _RESET, sep="")
     logger.error(message)
 
+@lru_cache(maxsize=1)
+def _embeddings():
+    """Shared OpenAI embeddings client, reusing one HTTP connection pool for all calls."""
+    return OpenAIEmbeddings(
+        model=EMBEDDING_MODEL,
+        chunk_size=2048,
+        max_retries=8,
+        timeout=60,
+        http_client=httpx.Client(limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)),
+    )
+
 def validate_environment():
     """Validate that all required environment variables are configured."""
     api_key = os.getenv("OPENAI_API_KEY")
@@ -68,75 +97,6 @@ def validate_environment():
         sys.exit(1)
     return True
 
-def load_documents(data_dir="/Users/gabrielramos/Downloads/DRIVE_DO_BELISARIO"):
-    """Load all .docx documents from the specified directory."""
-    print_info(f"Loading documents from: {data_dir}")
-
-    if not os.path.exists(data_dir):
-        print_error(f"Directory not found: {data_dir}")
-        sys.exit(1)
-
-    try:
-        loader = DirectoryLoader(
-            data_dir,
-            glob="**/*.docx",
-            loader_cls=Docx2txtLoader,
-            show_progress=True
-        )
-        documents = loader.load()
-
-        if not documents:
-            print_error("No documents loaded")
-            sys.exit(1)
-
-        print_success(f"Loaded {len(documents)} documents")
-        return documents
-
-    except Exception as e:
-        print_error(f"Error loading documents: {str(e)}")
-        logger.exception("Full traceback:")
-        sys.exit(1)
-
-def split_documents(documents, chunk_size=1000, chunk_overlap=200):
-    """Split documents into smaller chunks for embedding."""
-    print_info("Splitting documents into chunks...")
-
-    try:
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            length_function=len,
-        )
-        chunks = text_splitter.split_documents(documents)
-
-        if not chunks:
-            print_error("No chunks created")
-            sys.exit(1)
-
-        print_success(f"Created {len(chunks)} chunks")
-        return chunks
-
-    except Exception as e:
-        print_error(f"Error splitting documents: {str(e)}")
-        logger.exception("Full traceback:")
-        sys.exit(1)
-
-def create_vectorstore(chunks):
-    """Create FAISS vectorstore from document chunks using OpenAI embeddings."""
-    print_info("Creating embeddings and vectorstore...")
-
-    try:
-        embeddings = OpenAIEmbeddings()
-        vectorstore = FAISS.from_documents(chunks, embeddings)
-        vectorstore.save_local("vectorstore")
-        print_success("Vectorstore created and saved")
-        return vectorstore
-
-    except Exception as e:
-        print_error(f"Error creating vectorstore: {str(e)}")
-        logger.exception("Full traceback:")
-        sys.exit(1)
-
 def load_vectorstore():
     """Load existing vectorstore from disk."""
     print_info("Loading vectorstore from disk...")
@@ -147,12 +107,15 @@ def load_vectorstore():
         sys.exit(1)
 
     try:
-        embeddings = OpenAIEmbeddings()
+        # The index is read fully into RAM: FAISS's IO_FLAG_MMAP only maps IVF inverted lists,
+        # and load.py writes an HNSW index, so memory-mapping would not apply here.
         vectorstore = FAISS.load_local(
             "vectorstore",
-            embeddings,
+            _embeddings(),
             allow_dangerous_deserialization=True
         )
+        if hasattr(vectorstore.index, "hnsw"):
+            vectorstore.index.hnsw.efSearch = HNSW_EF_SEARCH
         print_success("Vectorstore loaded successfully")
         logger.info(f"Vectorstore loaded from disk")
         return vectorstore
@@ -169,9 +132,12 @@ def create_rag_chain(vectorstore):
 
     try:
         # Use ChatOpenAI instead of deprecated OpenAI
+        # Stream tokens to stdout as they are generated instead of waiting for the full answer
         llm = ChatOpenAI(
             model="gpt-3.5-turbo",
-            temperature=0
+            temperature=0,
+            streaming=True,
+            callbacks=[StreamingStdOutCallbackHandler()]
         )
 
         qa_chain = RetrievalQA.from_chain_type(
@@ -202,18 +168,8 @@ def main():
         # Validate environment
         validate_environment()
 
-        # Check if vectorstore exists
-        if os.path.exists("vectorstore"):
-            print_info("Found existing vectorstore, loading...")
-            vectorstore = load_vectorstore()
-        else:
-            print_warning("No vectorstore found, creating new one...")
-            print_warning("This will take a while and consume API credits.")
-            print()
-
-            docs = load_documents()
-            chunks = split_documents(docs)
-            vectorstore = create_vectorstore(chunks)
+        # The vectorstore is built by load.py; load_vectorstore exits with instructions if it is missing
+        vectorstore = load_vectorstore()
 
         # Create RAG chain
         qa_chain = create_rag_chain(vectorstore)
@@ -251,13 +207,15 @@ def main():
                 print_info("Processando sua pergunta...")
                 logger.debug(f"Query: {query}")
 
-                result = qa_chain({"query": query})
-                question_count += 1
-
                 print()
                 print_color("📝 Resposta:", Fore.CYAN, Style.BRIGHT)
                 print_color("-" * 70, Fore.CYAN)
-                print(result['result'])
+
+                # The answer is printed by the streaming callback while it is generated
+                result = qa_chain.invoke({"query": query})
+                question_count += 1
+
+                print()
                 print_color("-" * 70, Fore.CYAN)
 
                 # Show source documents